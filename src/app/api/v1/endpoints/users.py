@@ -1,27 +1,41 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
 from app.db.database import get_db
 from app.models.user import User
 from app.schemas.user import User as UserSchema, UserCreate, UserUpdate
 
 router = APIRouter()
 
+# Built once so the listing serializes straight to JSON bytes in pydantic-core
+users_adapter = TypeAdapter(List[UserSchema])
+
 
 @router.get("/", response_model=List[UserSchema])
-async def get_users(db: AsyncSession = Depends(get_db)):
-    """Get all users"""
-    result = await db.execute(select(User))
-    users = result.scalars().all()
-    return users
+async def get_users(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    after_id: Optional[int] = Query(
+        None, description="Keyset pagination: only return users with a larger ID"
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get users, paginated by offset or by the last seen ID"""
+    stmt = select(User).order_by(User.id)
+    if after_id is not None:
+        stmt = stmt.where(User.id > after_id)
+    result = await db.execute(stmt.offset(skip).limit(limit))
+    users = users_adapter.validate_python(result.scalars().all(), from_attributes=True)
+    return Response(users_adapter.dump_json(users), media_type="application/json")
 
 
 @router.get("/{user_id}", response_model=UserSchema)
 async def get_user(user_id: int, db: AsyncSession = Depends(get_db)):
     """Get a specific user by ID"""
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
@@ -30,15 +44,14 @@ async def get_user(user_id: int, db: AsyncSession = Depends(get_db)):
 @router.post("/", response_model=UserSchema)
 async def create_user(user: UserCreate, db: AsyncSession = Depends(get_db)):
     """Create a new user"""
-    # Check if email already exists
-    result = await db.execute(select(User).where(User.email == user.email))
-    if result.scalar_one_or_none():
-        raise HTTPException(status_code=400, detail="Email already registered")
-
     db_user = User(name=user.name, email=user.email, is_active=True)
     db.add(db_user)
-    await db.commit()
-    await db.refresh(db_user)
+    try:
+        # Rely on the unique index on email instead of checking beforehand
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Email already registered")
     return db_user
 
 
@@ -47,28 +60,30 @@ async def update_user(
     user_id: int, user_update: UserUpdate, db: AsyncSession = Depends(get_db)
 ):
     """Update a user"""
-    result = await db.execute(select(User).where(User.id == user_id))
-    db_user = result.scalar_one_or_none()
-    if not db_user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     update_data = user_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_user, field, value)
+    if update_data:
+        result = await db.execute(
+            update(User).where(User.id == user_id).values(**update_data).returning(User)
+        )
+        db_user = result.scalar_one_or_none()
+        await db.commit()
+    else:
+        db_user = await db.get(User, user_id)
 
-    await db.commit()
-    await db.refresh(db_user)
+    if not db_user:
+        raise HTTPException(status_code=404, detail="User not found")
     return db_user
 
 
 @router.delete("/{user_id}")
 async def delete_user(user_id: int, db: AsyncSession = Depends(get_db)):
     """Delete a user"""
-    result = await db.execute(select(User).where(User.id == user_id))
-    db_user = result.scalar_one_or_none()
-    if not db_user:
+    result = await db.execute(
+        delete(User).where(User.id == user_id).returning(User.name)
+    )
+    name = result.scalar_one_or_none()
+    if name is None:
         raise HTTPException(status_code=404, detail="User not found")
 
-    await db.delete(db_user)
     await db.commit()
-    return {"message": f"User {db_user.name} deleted successfully"}
+    return {"message": f"User {name} deleted successfully"}
@@ -1,5 +1,8 @@
-from typing import Optional
-from fastapi import Depends, HTTPException, status
+import hashlib
+import time
+from typing import Dict, Optional, Tuple
+
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,8 +12,72 @@ from app.db.database import get_db
 
 security = HTTPBearer()
 
+# Validated access tokens are cached briefly (keyed by their SHA-256 digest) so
+# repeated requests with the same token skip Supabase validation and only
+# re-load the local user by primary key.
+TOKEN_CACHE_TTL_SECONDS = 30
+TOKEN_CACHE_MAX_SIZE = 10000
+_token_cache: Dict[str, Tuple[int, float]] = {}
+
+
+def _token_cache_key(access_token: str) -> str:
+    return hashlib.sha256(access_token.encode()).hexdigest()
+
+
+def _get_cached_user_id(key: str) -> Optional[int]:
+    entry = _token_cache.get(key)
+    if entry is None:
+        return None
+
+    user_id, expires_at = entry
+    if expires_at <= time.monotonic():
+        _token_cache.pop(key, None)
+        return None
+    return user_id
+
+
+def _cache_user_id(key: str, user_id: int, exp: Optional[float]) -> None:
+    """Cache a successfully validated token, never beyond its own expiry"""
+    ttl = float(TOKEN_CACHE_TTL_SECONDS)
+    if exp is not None:
+        ttl = min(ttl, exp - time.time())
+    if ttl <= 0:
+        return
+
+    if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        _token_cache.pop(next(iter(_token_cache)), None)
+    _token_cache[key] = (user_id, time.monotonic() + ttl)
+
+
+async def _resolve_user(request: Request, access_token: str, db: AsyncSession) -> User:
+    """
+    Resolve the local user for an access token.
+    The user is kept on request.state so later lookups in the same request are
+    free, and across requests the token cache skips validation.
+    """
+    user = getattr(request.state, "user", None)
+    if user is not None:
+        return user
+
+    key = _token_cache_key(access_token)
+    user_id = _get_cached_user_id(key)
+    if user_id is not None:
+        user = await db.get(User, user_id)
+        if not user:
+            _token_cache.pop(key, None)
+
+    if user is None:
+        auth_service = AuthService(db=db)
+        user, claims = await auth_service.authenticate(access_token)
+        _cache_user_id(key, user.id, claims.get("exp"))
+
+    request.state.user = user
+    return user
+
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
 ) -> User:
@@ -27,9 +94,7 @@ async def get_current_user(
 
     try:
         # Get user from local database using the access token
-        auth_service = AuthService(db)
-        user = await auth_service.get_current_user(credentials.credentials)
-        return user
+        return await _resolve_user(request, credentials.credentials, db)
     except HTTPException:
         raise
     except Exception as e:
@@ -55,6 +120,7 @@ async def get_current_active_user(
 
 
 async def get_optional_current_user(
+    request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     db: AsyncSession = Depends(get_db),
 ) -> Optional[User]:
@@ -66,9 +132,7 @@ async def get_optional_current_user(
         return None
 
     try:
-        auth_service = AuthService(db)
-        user = await auth_service.get_current_user(credentials.credentials)
-        return user
+        return await _resolve_user(request, credentials.credentials, db)
     except Exception:
         return None
 
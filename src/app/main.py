@@ -1,7 +1,17 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.api.v1.router import api_router
 from app.core.config import settings
+from app.services.supabase_client import close_supabase_client
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    # Release the shared Supabase Auth connection pool on shutdown
+    yield
+    await close_supabase_client()
 
 
 def create_application() -> FastAPI:
@@ -12,6 +22,8 @@ def create_application() -> FastAPI:
         openapi_url=f"{settings.API_V1_STR}/openapi.json",
         docs_url=f"{settings.API_V1_STR}/docs",
         redoc_url=f"{settings.API_V1_STR}/redoc",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
     # Set up CORS
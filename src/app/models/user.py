@@ -1,4 +1,4 @@
-from sqlalchemy import String, DateTime
+from sqlalchemy import Index, String, DateTime, text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -8,6 +8,13 @@ from typing import Optional
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Partial index backing the active users listing
+        Index("ix_users_active", "is_active", postgresql_where=text("is_active")),
+    )
+    # Fetch server-generated columns (id, timestamps) with RETURNING during the
+    # flush, so they are loaded without a refresh() after insert or update
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     supabase_user_id: Mapped[Optional[str]] = mapped_column(
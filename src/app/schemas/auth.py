@@ -1,6 +1,8 @@
 from typing import Optional, Dict, Any
 from pydantic import BaseModel, EmailStr
 
+from app.schemas.user import UserResponse as LocalUserResponse
+
 
 class UserSignUp(BaseModel):
     email: EmailStr
@@ -18,7 +20,7 @@ class TokenResponse(BaseModel):
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
-    user: Dict[str, Any]
+    user: LocalUserResponse
 
 
 class RefreshTokenRequest(BaseModel):
@@ -45,7 +47,7 @@ class MessageResponse(BaseModel):
 
 class SignUpResponse(BaseModel):
     message: str
-    user: Dict[str, Any]
+    user: LocalUserResponse
     email_confirmation_required: bool = False
     access_token: Optional[str] = None
     refresh_token: Optional[str] = None
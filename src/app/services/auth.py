@@ -1,24 +1,26 @@
-from typing import Optional, Dict, Any
-from supabase import create_client
+from typing import Optional, Dict, Any, Tuple
+import jwt
 from fastapi import HTTPException, status
 from fastapi.security import HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.services.supabase_client import SupabaseAuthClient
 from app.services.user import UserService
 from app.schemas.user import UserCreate
 from app.models.user import User
 
-# Initialize Supabase client
-
 security = HTTPBearer()
 
 
 class AuthService:
-    def __init__(self, db: Optional[AsyncSession] = None):
-        self.supabase_client = create_client(
-            settings.SUPABASE_URL, settings.SUPABASE_KEY
-        )
+    def __init__(
+        self,
+        supabase_client: Optional[SupabaseAuthClient] = None,
+        db: Optional[AsyncSession] = None,
+    ):
+        # Token validation is offline, so only the Supabase Auth calls need a client
+        self.supabase_client = supabase_client
         self.db = db
 
     async def sign_up(
@@ -42,37 +44,31 @@ class AuthService:
                 name=user_create.name, email=user_create.email, is_active=True
             )
 
+            # flush() assigns the ID needed for the Supabase metadata
             self.db.add(local_user)
             await self.db.flush()
-            await self.db.refresh(local_user)
 
             supabase_metadata = metadata or {}
             supabase_metadata.update({"name": name, "local_user_id": local_user.id})
 
             # Create user in Supabase with local ID as metadata
-            response = self.supabase_client.auth.sign_up(
-                {
-                    "email": email,
-                    "password": password,
-                    "options": {"data": supabase_metadata},
-                }
-            )
-            print(response)
-            if not response.user:
+            response = await self.supabase_client.sign_up(
+                email, password, supabase_metadata
+            )
+            if not response["user"]:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Failed to create user in Supabase",
                 )
 
             # Update local user with Supabase ID
-            local_user.supabase_user_id = response.user.id
+            local_user.supabase_user_id = response["user"]["id"]
             await self.db.commit()
-            await self.db.refresh(local_user)
 
             return {
                 "user": local_user,
-                "session": response.session,
-                "supabase_user": response.user,
+                "session": response["session"],
+                "supabase_user": response["user"],
                 "message": "User created successfully",
             }
 
@@ -91,27 +87,28 @@ class AuthService:
             )
 
         try:
-            response = self.supabase_client.auth.sign_in_with_password(
-                {"email": email, "password": password}
-            )
+            response = await self.supabase_client.sign_in_with_password(email, password)
 
-            if not (response.user and response.session):
+            if not (response["user"] and response["session"]):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid credentials",
                 )
 
+            supabase_user = response["user"]
+            user_metadata = supabase_user.get("user_metadata") or {}
+
             # Get local user record
             user_service = UserService(self.db)
-            local_user = await user_service.get_user_by_supabase_id(response.user.id)
+            local_user = await user_service.get_user_by_supabase_id(supabase_user["id"])
 
             # If not found, try to get by local_user_id from metadata
-            if not local_user and response.user.user_metadata:
-                local_user_id = response.user.user_metadata.get("local_user_id")
+            if not local_user and user_metadata:
+                local_user_id = user_metadata.get("local_user_id")
                 if local_user_id:
                     local_user = await user_service.get_user_by_id(local_user_id)
                     if local_user:
-                        local_user.supabase_user_id = response.user.id
+                        local_user.supabase_user_id = supabase_user["id"]
                         await self.db.commit()
 
             if not local_user:
@@ -120,23 +117,24 @@ class AuthService:
                 if local_user:
                     # Link existing user to Supabase ID
                     local_user = await user_service.link_supabase_user(
-                        email, response.user.id
+                        email, supabase_user["id"]
                     )
                 else:
                     # Create local user if it doesn't exist
                     user_create = UserCreate(
-                        name=response.user.user_metadata.get("name", "Unknown"),
+                        name=user_metadata.get("name", "Unknown"),
                         email=email,
                     )
                     local_user = await user_service.create_user(
-                        user_create, response.user.id
+                        user_create, supabase_user["id"]
                     )
 
+            session = response["session"]
             return {
                 "user": local_user,
-                "session": response.session,
-                "access_token": response.session.access_token,
-                "refresh_token": response.session.refresh_token,
+                "session": session,
+                "access_token": session["access_token"],
+                "refresh_token": session["refresh_token"],
                 "token_type": "bearer",
             }
 
@@ -151,8 +149,7 @@ class AuthService:
     async def sign_out(self, access_token: str) -> Dict[str, str]:
         """Sign out user"""
         try:
-            self.supabase_client.auth.set_session(access_token, "")
-            self.supabase_client.auth.sign_out()
+            await self.supabase_client.sign_out(access_token)
             return {"message": "Successfully signed out"}
         except Exception as e:
             raise HTTPException(
@@ -161,74 +158,119 @@ class AuthService:
             )
 
     async def refresh_token(self, refresh_token: str) -> Dict[str, Any]:
-        """Refresh access token"""
+        """Refresh access token and load the local user it belongs to"""
+        if not self.db:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Database session not available",
+            )
+
         try:
-            response = self.supabase_client.auth.refresh_session(refresh_token)
-            if response.session:
-                return {
-                    "access_token": response.session.access_token,
-                    "refresh_token": response.session.refresh_token,
-                    "token_type": "bearer",
-                }
-            else:
+            response = await self.supabase_client.refresh_session(refresh_token)
+            if not (response["user"] and response["session"]):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid refresh token",
                 )
+
+            # The refreshed session already identifies the user, so there is
+            # no need to validate the new access token again
+            local_user = await self._get_local_user(
+                response["user"]["id"], response["user"].get("user_metadata")
+            )
+
+            session = response["session"]
+            return {
+                "user": local_user,
+                "access_token": session["access_token"],
+                "refresh_token": session["refresh_token"],
+                "token_type": "bearer",
+            }
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=f"Token refresh failed: {str(e)}",
             )
 
-    async def get_current_user(self, access_token: str) -> User:
-        """Get current local user from access token"""
-        if not self.db:
+    def _decode_access_token(self, access_token: str) -> Dict[str, Any]:
+        """Verify a Supabase access token offline and return its claims"""
+        if not settings.JWT_SECRET_KEY:
+            # Fail closed: without the project secret no token can be trusted
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Database session not available",
+                detail="JWT secret key is not configured",
             )
 
         try:
-            # Set the session with the access token
-            self.supabase_client.auth.set_session(access_token, "")
+            return jwt.decode(
+                access_token,
+                settings.JWT_SECRET_KEY,
+                algorithms=[settings.JWT_ALGORITHM],
+                audience=settings.JWT_AUDIENCE,
+                options={"require": ["exp", "sub"]},
+            )
+        except jwt.PyJWTError as e:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=f"Invalid token: {str(e)}",
+            )
 
-            # Get user from Supabase
-            supabase_response = self.supabase_client.auth.get_user(access_token)
+    async def _get_local_user(
+        self, supabase_user_id: str, user_metadata: Optional[Dict[str, Any]]
+    ) -> User:
+        """Get the local user linked to a Supabase user"""
+        # Get local user record
+        user_service = UserService(self.db)
+        local_user = None
+
+        # First try to get user by Supabase ID
+        local_user = await user_service.get_user_by_supabase_id(supabase_user_id)
+
+        # If not found, try to get by local_user_id from metadata
+        if not local_user and user_metadata:
+            local_user_id = user_metadata.get("local_user_id")
+            if local_user_id:
+                local_user = await user_service.get_user_by_id(int(local_user_id))
+                if local_user:
+                    # Update with Supabase ID if found
+                    local_user.supabase_user_id = supabase_user_id
+                    await self.db.commit()
 
-            if not supabase_response.user:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
-                )
+        if not local_user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found in local database",
+            )
 
-            # Get local user record
-            user_service = UserService(self.db)
-            local_user = None
+        return local_user
 
-            # First try to get user by Supabase ID
-            local_user = await user_service.get_user_by_supabase_id(
-                supabase_response.user.id
-            )
+    async def get_current_user(self, access_token: str) -> User:
+        """Get current local user from access token"""
+        local_user, _ = await self.authenticate(access_token)
+        return local_user
 
-            # If not found, try to get by local_user_id from metadata
-            if not local_user and supabase_response.user.user_metadata:
-                local_user_id = supabase_response.user.user_metadata.get(
-                    "local_user_id"
-                )
-                if local_user_id:
-                    local_user = await user_service.get_user_by_id(int(local_user_id))
-                    if local_user:
-                        # Update with Supabase ID if found
-                        local_user.supabase_user_id = supabase_response.user.id
-                        await self.db.commit()
+    async def authenticate(self, access_token: str) -> Tuple[User, Dict[str, Any]]:
+        """Get current local user and the verified claims of the access token"""
+        if not self.db:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Database session not available",
+            )
 
-            if not local_user:
+        try:
+            # Validate the Supabase JWT locally instead of calling auth.get_user
+            payload = self._decode_access_token(access_token)
+            supabase_user_id = payload.get("sub")
+            if not supabase_user_id:
                 raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="User not found in local database",
+                    status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
                 )
+            user_metadata = payload.get("user_metadata") or {}
 
-            return local_user
+            local_user = await self._get_local_user(supabase_user_id, user_metadata)
+            return local_user, payload
 
         except HTTPException:
             raise
@@ -241,7 +283,7 @@ class AuthService:
     async def reset_password(self, email: str) -> Dict[str, str]:
         """Send password reset email"""
         try:
-            self.supabase_client.auth.reset_password_email(email)
+            await self.supabase_client.reset_password_email(email)
             return {"message": "Password reset email sent"}
         except Exception as e:
             raise HTTPException(
@@ -250,4 +292,5 @@ class AuthService:
             )
 
 
-# AuthService is now instantiated per request with database session
+# AuthService is instantiated per request with the shared Supabase client and/or
+# a database session, depending on what the endpoint needs
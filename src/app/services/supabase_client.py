@@ -0,0 +1,119 @@
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+
+
+class SupabaseAuthError(Exception):
+    """Error response from the Supabase Auth API"""
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class SupabaseAuthClient:
+    """
+    Minimal async client for the Supabase Auth (GoTrue) REST API.
+    It keeps no session state: user tokens are only passed per call, so a
+    single instance can be shared by concurrent requests.
+    """
+
+    def __init__(self, url: str, key: str):
+        self._http = httpx.AsyncClient(
+            base_url=f"{url.rstrip('/')}/auth/v1",
+            headers={"apikey": key, "Authorization": f"Bearer {key}"},
+            timeout=10.0,
+        )
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        access_token: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Any:
+        headers = {"Authorization": f"Bearer {access_token}"} if access_token else None
+        response = await self._http.request(method, path, headers=headers, **kwargs)
+        if response.is_error:
+            try:
+                data = response.json()
+            except ValueError:
+                data = {}
+            message = next(
+                (
+                    data[prop]
+                    for prop in ("msg", "message", "error_description", "error")
+                    if isinstance(data, dict) and data.get(prop)
+                ),
+                response.text or response.reason_phrase,
+            )
+            raise SupabaseAuthError(message, response.status_code)
+        return response.json() if response.content else None
+
+    @staticmethod
+    def _parse_auth_response(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Split a GoTrue response into the user and, if issued, the session"""
+        session = (
+            data if data.get("access_token") and data.get("refresh_token") else None
+        )
+        return {"user": data.get("user", data) or None, "session": session}
+
+    async def sign_up(
+        self, email: str, password: str, data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        response = await self._request(
+            "POST",
+            "/signup",
+            json={"email": email, "password": password, "data": data or {}},
+        )
+        return self._parse_auth_response(response)
+
+    async def sign_in_with_password(self, email: str, password: str) -> Dict[str, Any]:
+        response = await self._request(
+            "POST",
+            "/token",
+            params={"grant_type": "password"},
+            json={"email": email, "password": password},
+        )
+        return self._parse_auth_response(response)
+
+    async def refresh_session(self, refresh_token: str) -> Dict[str, Any]:
+        response = await self._request(
+            "POST",
+            "/token",
+            params={"grant_type": "refresh_token"},
+            json={"refresh_token": refresh_token},
+        )
+        return self._parse_auth_response(response)
+
+    async def sign_out(self, access_token: str, scope: str = "global") -> None:
+        await self._request(
+            "POST", "/logout", access_token=access_token, params={"scope": scope}
+        )
+
+    async def reset_password_email(self, email: str) -> None:
+        await self._request("POST", "/recover", json={"email": email})
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+
+@lru_cache
+def get_supabase_client() -> SupabaseAuthClient:
+    """Return the process-wide Supabase Auth client, created on first use"""
+    return SupabaseAuthClient(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+
+
+async def close_supabase_client() -> None:
+    """Close the shared client's connection pool, if it was ever created"""
+    if get_supabase_client.cache_info().currsize:
+        await get_supabase_client().aclose()
+        get_supabase_client.cache_clear()
+
+
+async def get_supabase() -> SupabaseAuthClient:
+    """Dependency returning the shared Supabase Auth client"""
+    return get_supabase_client()
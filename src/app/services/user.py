@@ -1,6 +1,6 @@
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, or_, select, update
 from fastapi import HTTPException, status
 
 from app.models.user import User
@@ -13,17 +13,24 @@ class UserService:
 
     async def create_user(self, user_create: UserCreate, supabase_user_id: str) -> User:
         """Create a new user linked to Supabase user"""
-        # Check if user with this email already exists
-        existing_user = await self.get_user_by_email(user_create.email)
-        if existing_user:
+        # Check for an existing email or Supabase ID in a single query
+        result = await self.db.execute(
+            select(User.email, User.supabase_user_id).where(
+                or_(
+                    User.email == user_create.email,
+                    User.supabase_user_id == supabase_user_id,
+                )
+            )
+        )
+        existing = result.all()
+
+        if any(row.email == user_create.email for row in existing):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="User with this email already exists",
             )
 
-        # Check if user with this Supabase ID already exists
-        existing_supabase_user = await self.get_user_by_supabase_id(supabase_user_id)
-        if existing_supabase_user:
+        if existing:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="User with this Supabase ID already exists",
@@ -38,23 +45,28 @@ class UserService:
 
         self.db.add(db_user)
         await self.db.commit()
-        await self.db.refresh(db_user)
         return db_user
 
     async def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Get user by internal ID"""
-        result = await self.db.execute(select(User).where(User.id == user_id))
-        return result.scalar_one_or_none()
+        # Checks the session identity map first and only queries on a miss
+        return await self.db.get(User, user_id)
 
+    # Lookups by other unique columns use lambda_stmt so the statement is built
+    # and compiled once, later calls only swap in the bound parameter
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
-        result = await self.db.execute(select(User).where(User.email == email))
+        result = await self.db.execute(
+            lambda_stmt(lambda: select(User).where(User.email == email))
+        )
         return result.scalar_one_or_none()
 
     async def get_user_by_supabase_id(self, supabase_user_id: str) -> Optional[User]:
         """Get user by Supabase user ID"""
         result = await self.db.execute(
-            select(User).where(User.supabase_user_id == supabase_user_id)
+            lambda_stmt(
+                lambda: select(User).where(User.supabase_user_id == supabase_user_id)
+            )
         )
         return result.scalar_one_or_none()
 
@@ -71,23 +83,27 @@ class UserService:
             setattr(db_user, field, value)
 
         await self.db.commit()
-        await self.db.refresh(db_user)
         return db_user
 
     async def delete_user(self, user_id: int) -> bool:
         """Delete user (soft delete by setting is_active to False)"""
-        db_user = await self.get_user_by_id(user_id)
-        if not db_user:
-            return False
-
-        db_user.is_active = False
+        result = await self.db.execute(
+            update(User)
+            .where(User.id == user_id, User.is_active == True)  # noqa: E712
+            .values(is_active=False)
+            .returning(User.id)
+        )
+        deleted_id = result.scalar_one_or_none()
         await self.db.commit()
-        return True
+        return deleted_id is not None
 
     async def get_users(self, skip: int = 0, limit: int = 100) -> List[User]:
         """Get list of users with pagination"""
         result = await self.db.execute(
-            select(User).where(User.is_active is True).offset(skip).limit(limit)
+            select(User)
+            .where(User.is_active == True)  # noqa: E712
+            .offset(skip)
+            .limit(limit)
         )
         return result.scalars().all()
 
@@ -101,5 +117,4 @@ class UserService:
 
         db_user.supabase_user_id = supabase_user_id
         await self.db.commit()
-        await self.db.refresh(db_user)
         return db_user